@@ -58,6 +58,8 @@ def url_validator(compiler, scheme='http https', default_schema=None, relaxed=Fa
         raise SchemaError('invalid default_schema {}'.format(default_schema))
     _django_validate_url = URLValidator(schemes=schemes)
 
+    # django URLValidator is slow, and urls of a feed repeat a lot
+    @functools.lru_cache(maxsize=1024)
     def validate(value):
         if default_schema:
             value = coerce_url(value, default_schema=default_schema)
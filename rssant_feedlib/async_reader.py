@@ -111,15 +111,16 @@ class AsyncFeedReader:
                     content_length, self.max_content_length)
                 raise ContentTooLargeError(msg)
         content_length = 0
-        content = bytearray()
+        # keep immutable bytes, the parser can strip and wrap it without copy
+        chunks = []
         async for chunk in response.content.iter_chunked(8 * 1024):
             content_length += len(chunk)
             if content_length > self.max_content_length:
                 msg = 'content length larger than limit {}'.format(
                     self.max_content_length)
                 raise ContentTooLargeError(msg)
-            content.extend(chunk)
-        return content
+            chunks.append(chunk)
+        return b''.join(chunks)
 
     async def _read_text(self, response: aiohttp.ClientResponse):
         content = await self._read_content(response)
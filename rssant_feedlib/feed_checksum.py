@@ -41,11 +41,9 @@ class FeedChecksum:
         return len(self._map)
 
     def copy(self) -> "FeedChecksum":
-        items = list(self._map.items())
-        return FeedChecksum(items, version=self.version)
-
-    def _hash(self, value: str, length: int) -> bytes:
-        return hashlib.md5(value.encode('utf-8')).digest()[:length]
+        result = FeedChecksum(version=self.version)
+        result._map = self._map.copy()
+        return result
 
     def update(self, ident: str, content: str) -> bool:
         """
@@ -55,10 +53,10 @@ class FeedChecksum:
         """
         if not ident:
             raise ValueError('ident can not be empty')
-        key = self._hash(ident, self._key_len)
-        old_sum = self._map.get(key)
-        new_sum = self._hash(content, self._val_len)
-        if (not old_sum) or old_sum != new_sum:
+        # keep md5, the dumped checksum of existing feeds depends on it
+        key = hashlib.md5(ident.encode('utf-8')).digest()[:self._key_len]
+        new_sum = hashlib.md5(content.encode('utf-8')).digest()[:self._val_len]
+        if self._map.get(key) != new_sum:
             self._map[key] = new_sum
             return True
         return False
@@ -71,16 +69,20 @@ class FeedChecksum:
 
     def dump(self, limit=None) -> bytes:
         length = len(self._map)
-        keys_buffer = bytearray()
-        vals_buffer = bytearray()
-        version_bytes = struct.pack('>B', self.version)
-        items = self._map.items()
+        keys = self._map.keys()
+        vals = self._map.values()
         if limit is not None and length > limit:
-            items = itertools.islice(items, length - limit, length)
-        for key, value in items:
-            self._check_key_value(key, value)
-            keys_buffer.extend(key)
-            vals_buffer.extend(value)
+            keys = itertools.islice(keys, length - limit, length)
+            vals = itertools.islice(vals, length - limit, length)
+            length = limit
+        # keys and values are stored in two contiguous blocks, join each at once
+        keys_buffer = b''.join(keys)
+        vals_buffer = b''.join(vals)
+        if len(keys_buffer) != length * self._key_len:
+            raise ValueError(f'key length must be {self._key_len} bytes')
+        if len(vals_buffer) != length * self._val_len:
+            raise ValueError(f'value length must be {self._val_len} bytes')
+        version_bytes = struct.pack('>B', self.version)
         return version_bytes + keys_buffer + vals_buffer
 
     @classmethod
@@ -95,9 +97,10 @@ class FeedChecksum:
         vals_buffer = memoryview(data)[1 + n * cls._key_len:]
         key_packer = struct.Struct(str(cls._key_len) + 's')
         val_packer = struct.Struct(str(cls._val_len) + 's')
-        items = []
         keys_iter = key_packer.iter_unpack(keys_buffer)
         vals_iter = val_packer.iter_unpack(vals_buffer)
-        for (key,), (value,) in zip(keys_iter, vals_iter):
-            items.append((key, value))
-        return cls(items, version=version)
+        # length of each key and value is guaranteed by the unpacker
+        result = cls(version=version)
+        result._map = OrderedDict(
+            (key, value) for (key,), (value,) in zip(keys_iter, vals_iter))
+        return result
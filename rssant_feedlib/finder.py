@@ -2,10 +2,12 @@ import logging
 from typing import Tuple
 from urllib.parse import urlsplit, urlunsplit, unquote, urljoin
 
+import lxml.html
 from bs4 import BeautifulSoup
 
 from rssant_common.helper import coerce_url
 
+from .helper import lxml_call, LXMLError
 from .raw_parser import RawFeedParser, FeedParserError
 from .parser import FeedParser, FeedResult
 from .reader import FeedReader
@@ -273,10 +275,17 @@ class FeedFinder:
             else:
                 self._links[link.url] = link
 
+    def _find_tags(self, text):
+        try:
+            dom = lxml_call(lxml.html.fromstring, text)
+        except LXMLError as ex:
+            LOG.info('lxml unable to parse html, fallback to BeautifulSoup: %s', ex)
+            return BeautifulSoup(text, "html.parser").find_all(["link", "a"])
+        return dom.iter("link", "a")
+
     def _find_links(self, text, page_url):
-        soup = BeautifulSoup(text, "html.parser")
         links = []
-        for tag in soup.find_all(["link", "a"]):
+        for tag in self._find_tags(text):
             link = self._parse_link(tag, page_url)
             if link is None:
                 continue
@@ -1,5 +1,6 @@
 import logging
 from typing import List
+from collections import namedtuple
 
 from validr import Invalid, T, mark_index
 
@@ -50,6 +51,17 @@ StorySchema = T.dict(
 validate_feed = compiler.compile(FeedSchema)
 validate_story = compiler.compile(StorySchema)
 
+# parsed story before validate, much smaller than dict when hold many storys,
+# validr read it by attributes and output dict.
+ParsedStory = namedtuple('ParsedStory', (
+    'ident, title, url, content, summary, has_mathjax, image_url, '
+    'dt_published, dt_updated, author_name, author_url, author_avatar_url'
+))
+
+
+# save story content as plain text if larger than this
+STORY_CONTENT_MAX_LENGTH = 1024 * 1024
+
 
 class FeedResult:
 
@@ -93,11 +105,11 @@ class FeedParser:
 
     def _parse_feed(self, feed: dict):
         url = feed['url']
-        title = story_html_to_text(feed['title'])[:200]
+        title = story_html_to_text(feed['title'], max_length=200)
         home_url = normlize_url(feed['home_url'], base_url=url)
         icon_url = normlize_url(feed['icon_url'], base_url=url)
-        description = story_html_to_text(feed['description'])[:300]
-        author_name = story_html_to_text(feed['author_name'])[:100]
+        description = story_html_to_text(feed['description'], max_length=300)
+        author_name = story_html_to_text(feed['author_name'], max_length=100)
         author_url = normlize_url(feed['author_url'], base_url=url)
         author_avatar_url = normlize_url(feed['author_avatar_url'], base_url=url)
         return dict(
@@ -114,8 +126,10 @@ class FeedParser:
         )
 
     def _process_content(self, content, link):
-        content = story_html_clean(content)
-        if len(content) >= 1024 * 1024:
+        # check raw length first, avoid clean large content only to discard it
+        if (not content) or len(content) < STORY_CONTENT_MAX_LENGTH:
+            content = story_html_clean(content)
+        if len(content) >= STORY_CONTENT_MAX_LENGTH:
             msg = 'too large story link=%r content length=%s, will only save plain text!'
             LOG.warning(msg, link, len(content))
             content = story_html_to_text(content)
@@ -124,7 +138,7 @@ class FeedParser:
 
     def _parse_story(self, story: dict, feed_url: str):
         ident = story['ident'][:200]
-        title = story_html_to_text(story['title'])[:200]
+        title = story_html_to_text(story['title'], max_length=200)
         url = normlize_url(story['url'] or story['ident'], base_url=feed_url)
         try:
             valid_url = validate_url(url)
@@ -132,14 +146,16 @@ class FeedParser:
             valid_url = None
         base_url = valid_url or feed_url
         image_url = normlize_url(story['image_url'], base_url=base_url)
-        author_name = story_html_to_text(story['author_name'])[:100]
+        author_name = story_html_to_text(story['author_name'], max_length=100)
         author_url = normlize_url(story['author_url'], base_url=base_url)
         author_avatar_url = normlize_url(story['author_avatar_url'], base_url=base_url)
         content = self._process_content(story['content'], link=base_url)
-        summary = story_html_clean(story['summary'])
-        summary = shorten(story_html_to_text(summary), width=300)
+        # story_html_to_text cleaner is stricter than story_html_clean,
+        # no need to clean summary before convert it to text, one more char
+        # than width let shorten know the summary is truncated
+        summary = shorten(story_html_to_text(story['summary'], max_length=301), width=300)
         has_mathjax = story_has_mathjax(content)
-        return dict(
+        return ParsedStory(
             ident=ident,
             title=title,
             url=valid_url,
@@ -154,35 +170,61 @@ class FeedParser:
             author_avatar_url=author_avatar_url,
         )
 
-    def _validate_result(self, result: FeedResult) -> FeedResult:
-        storys = []
+    def _validate_feed(self, feed: dict) -> dict:
         try:
-            feed = validate_feed(result.feed)
-            for i, s in enumerate(result.storys):
+            return validate_feed(feed)
+        except Invalid as ex:
+            raise FeedParserError(str(ex)) from ex
+
+    def _validate_storys(self, storys: list) -> list:
+        try:
+            return [validate_story(s) for s in storys]
+        except Invalid:
+            pass  # rarely happen, validate again to report the story index
+        result = []
+        try:
+            for i, s in enumerate(storys):
                 with mark_index(i):
-                    s = validate_story(s)
-                    storys.append(s)
+                    result.append(validate_story(s))
         except Invalid as ex:
             raise FeedParserError(str(ex)) from ex
+        return result
+
+    def _validate_result(self, result: FeedResult) -> FeedResult:
+        feed = self._validate_feed(result.feed)
+        storys = self._validate_storys(result.storys)
         return FeedResult(feed, storys, checksum=result.checksum)
 
     def _check_update_storys(self, storys: list):
         update_storys = []
+        checksum_update = self._checksum.update
+        # duplicate ident with same content is not updated, skip hashing it again
+        seen = {}
         for story in storys:
             ident = story['ident']
             content = story['content'] or ''
-            if self._checksum.update(ident, content):
+            if ident in seen and seen[ident] == content:
+                continue
+            seen[ident] = content
+            if checksum_update(ident, content):
                 update_storys.append(story)
         return update_storys
 
     def parse(self, raw: RawFeedResult) -> FeedResult:
         update_storys = self._check_update_storys(raw.storys)
         feed = self._parse_feed(raw.feed)
+        if not update_storys:
+            # common case of incremental parse, only feed info need validate
+            if self._validate:
+                feed = self._validate_feed(feed)
+            return FeedResult(feed, [], checksum=self._checksum)
         feed_url = feed['url']
         storys = []
         for story in update_storys:
             story = self._parse_story(story, feed_url=feed_url)
             storys.append(story)
+        if not self._validate:
+            storys = [dict(x._asdict()) for x in storys]
         result = FeedResult(feed, storys, checksum=self._checksum)
         if self._validate:
             result = self._validate_result(result)
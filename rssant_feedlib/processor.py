@@ -1,5 +1,6 @@
 import typing
 import re
+import functools
 import logging
 from collections import namedtuple
 from urllib.parse import urljoin, quote, unquote, urlsplit, urlunsplit
@@ -8,6 +9,7 @@ import lxml.etree
 import lxml.html
 from lxml.html import soupparser
 from lxml.html.defs import safe_attrs as lxml_safe_attrs
+from lxml.html.defs import link_attrs as lxml_link_attrs
 from lxml.html.clean import Cleaner
 from readability import Document as ReadabilityDocument
 from django.utils.html import escape as html_escape
@@ -24,12 +26,14 @@ LOG = logging.getLogger(__name__)
 
 validate_url = compiler.compile(T.url)
 
+# NOTE: avoid ambiguous quantifiers like `\s*.*?\s+`, they cause
+# catastrophic backtracking on malformed content, eg: '<a' + ' ' * 3000
 RE_IMG = re.compile(
-    r'(?:<img\s*[^<>]*?\s+src="([^"]+?)")|'
-    r'(?:<source\s*[^<>]*?\s+srcset="([^"]+?)")',
+    r'(?:<img\s[^<>]*?(?<=\s)src="([^"]+?)")|'
+    r'(?:<source\s[^<>]*?(?<=\s)srcset="([^"]+?)")',
     re.I | re.M)
 
-RE_LINK = re.compile(r'<a\s*.*?\s+href="([^"]+?)"', re.I | re.M)
+RE_LINK = re.compile(r'<a\s[^<>]*?(?<=\s)href="([^"]+?)"', re.I | re.M)
 
 
 def story_image_count(content):
@@ -78,6 +82,8 @@ RE_MATHJAX = re.compile((
     r'(\$[^\$]+?\$)|'                           # $...$
     r'(\`[^\`]+?\`)'                             # `...`
 ), re.I)
+# all RE_MATHJAX keywords contains math, other patterns need $, \ or `
+RE_MATHJAX_KEYWORD = re.compile(r'math', re.I)
 
 
 def story_has_mathjax(content):
@@ -96,9 +102,15 @@ def story_has_mathjax(content):
     True
     >>> story_has_mathjax(r'hi `x^2` ok?')
     True
+    >>> story_has_mathjax(r'<p>hi x^2 ok?</p>')
+    False
     """
     if not content:
         return False
+    # most storys has no math, check cheap sentinels before the full regex
+    if not ('$' in content or '\\' in content or '`' in content
+            or RE_MATHJAX_KEYWORD.search(content)):
+        return False
     return bool(RE_MATHJAX.search(content))
 
 
@@ -120,8 +132,11 @@ def is_replaced_image(url):
     return url and RSSANT_IMAGE_TAG in url
 
 
+RE_IS_URL = re.compile(r'^https?:\/\/')
+
+
 def _is_url(url):
-    return bool(re.match(r'^https?:\/\/', url))
+    return bool(RE_IS_URL.match(url))
 
 
 def make_absolute_url(url, base_href):
@@ -155,15 +170,36 @@ xyz
 
 RE_STICK_DOMAIN = re.compile(r'^({})[^\:\/$]'.format('|'.join(TOP_DOMAINS)))
 
+RE_OTHER_SCHEME = re.compile(r'^[a-zA-Z0-9]+:')
+RE_SIMPLE_TEXT = re.compile(r'^(\.|\:|\/)?[a-zA-Z0-9\/]+(\.|\:|\/)')
+RE_HTTP_SCHEME = re.compile(r'https?://')
+RE_DOMAIN_SUFFIX = re.compile(r'\.[^.]+?(\/|$)')
+RE_PATH_SLASHES = re.compile(r'^\/\/+')
+
+
+# only cache short urls, avoid pin large strings like data url in memory
+NORMLIZE_URL_CACHE_MAX_LENGTH = 300
+
 
 def normlize_url(url: str, base_url: str = None):
     """
-    Normalize URL
+    Normalize URL, results of short urls are cached since feed, author
+    and image urls repeat
 
     Note: not support urn and magnet
         urn:kill-the-newsletter:2wqcdaqwddn9lny1ewzy
         magnet:?xt=urn:btih:28774CFFE3B4715054E192FF
     """
+    if (
+        url and len(url) <= NORMLIZE_URL_CACHE_MAX_LENGTH
+        and (not base_url or len(base_url) <= NORMLIZE_URL_CACHE_MAX_LENGTH)
+        and (_is_url(url) or not RE_OTHER_SCHEME.match(url))
+    ):
+        return _cached_normlize_url(url, base_url)
+    return _normlize_url(url, base_url)
+
+
+def _normlize_url(url: str, base_url: str = None):
     url = (url or '').strip()
     if not url:
         return url
@@ -173,23 +209,23 @@ def normlize_url(url: str, base_url: str = None):
         url = 'http' + url
     if not _is_url(url):
         # ignore urn: or magnet:
-        if re.match(r'^[a-zA-Z0-9]+:', url):
+        if RE_OTHER_SCHEME.match(url):
             return url
         if base_url:
             url = urljoin(base_url, url)
         else:
             # ignore simple texts
-            if not re.match(r'^(\.|\:|\/)?[a-zA-Z0-9\/]+(\.|\:|\/)', url):
+            if not RE_SIMPLE_TEXT.match(url):
                 return url
             url = 'http://' + url
     # fix: http://www.example.comhttp://www.example.com/hello
     if url.count('://') >= 2:
-        matchs = list(re.finditer(r'https?://', url))
+        matchs = list(RE_HTTP_SCHEME.finditer(url))
         if matchs:
             url = url[matchs[-1].start(0):]
         else:
             url = 'http://' + url.split('://')[-1]
-    match = re.search(r'\.[^.]+?(\/|$)', url)
+    match = RE_DOMAIN_SUFFIX.search(url)
     if match:
         # fix: http://example.com%5Cblog
         match_text = unquote(match.group(0))
@@ -208,13 +244,16 @@ def normlize_url(url: str, base_url: str = None):
     if scheme == 'https' and netloc.endswith(':443'):
         netloc = netloc.split(':')[0]
     # fix: http://example.com//blog
-    path = re.sub(r'^\/\/+', '/', path)
+    path = RE_PATH_SLASHES.sub('/', path)
     # quote is not idempotent, can not quote multiple times
     path = quote(unquote(path))
     url = urlunsplit((scheme, netloc, path, query, fragment))
     return url
 
 
+_cached_normlize_url = functools.lru_cache(maxsize=1024)(_normlize_url)
+
+
 class StoryImageProcessor:
     """
     >>> content = '''
@@ -311,6 +350,38 @@ def is_image_url(url):
     return bool(RE_IMAGE_URL.search(url))
 
 
+LXML_LINK_ATTRS = frozenset(lxml_link_attrs)
+# lxml iterlinks treat these specially, eg: css url, meta refresh, object codebase
+LXML_COMPLEX_LINK_TAGS = frozenset(['object', 'param', 'meta', 'style'])
+
+
+def _make_links_absolute(dom, base_url):
+    """
+    Same as lxml make_links_absolute, but only check attributes the element
+    has, lxml iterlinks check every link attribute of every element.
+    Links are relative to story link, <base> in content is removed.
+    """
+    for el in list(dom.iter('base')):
+        if el.getparent() is not None:
+            el.drop_tree()
+    links = []
+    for el in dom.iter(lxml.etree.Element):
+        if el.tag in LXML_COMPLEX_LINK_TAGS:
+            dom.make_links_absolute(base_url, resolve_base_href=False)
+            return
+        for attr in el.keys():
+            if attr in LXML_LINK_ATTRS:
+                links.append((el, attr))
+            elif attr == 'style':
+                dom.make_links_absolute(base_url, resolve_base_href=False)
+                return
+    for el, attr in links:
+        link = el.get(attr)
+        new_link = urljoin(base_url, link.strip())
+        if new_link != link:
+            el.set(attr, new_link)
+
+
 def process_story_links(content, story_link):
     """
     NOTE: Don't process_story_links after StoryImageProcessor, the replaced
@@ -328,9 +399,6 @@ def process_story_links(content, story_link):
         return content
     dom = lxml_call(lxml.html.fromstring, content)
     for a in dom.iter('a'):
-        url = a.get('href')
-        if url:
-            a.set('href', make_absolute_url(url, story_link))
         a.set('target', '_blank')
         a.set('rel', 'nofollow')
     for x in dom.iter('img'):
@@ -341,11 +409,10 @@ def process_story_links(content, story_link):
                 ext_src = value
                 break
         if ext_src:
-            src = make_absolute_url(ext_src, story_link)
-            x.set('src', src)
-    # also make image, video... other links absolute
+            x.set('src', ext_src)
+    # make a href, img src, video... all links absolute in one pass
     if story_link:
-        dom.make_links_absolute(story_link)
+        _make_links_absolute(dom, story_link)
     result = lxml.html.tostring(dom, encoding='unicode')
     if isinstance(result, bytes):
         result = result.decode('utf-8')
@@ -366,6 +433,9 @@ def story_readability(content):
 
 RE_BLANK_LINE = re.compile(r'(\n\s*)(\n\s*)+')
 
+# control characters not allowed in XML, lxml refuse to set them into tree
+RE_XML_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
 lxml_html_parser = lxml.html.HTMLParser(
     remove_blank_text=True, remove_comments=True, collect_ids=False)
 
@@ -388,7 +458,47 @@ lxml_text_html_cleaner = Cleaner(
 )
 
 
-def story_html_to_text(content, clean=True):
+def _is_plain_text(content):
+    """
+    Printable text without markup or entity, lxml output it unchanged.
+    str.isprintable and str.__contains__ scan the text in C.
+    """
+    return content.isprintable() and '<' not in content and '&' not in content
+
+
+def _lxml_clean_tree(cleaner, dom):
+    try:
+        cleaner(dom)
+    except Exception as ex:  # lxml will raise too many errors
+        raise LXMLError(ex) from ex
+
+
+def _normalize_text(text):
+    return RE_BLANK_LINE.sub('\n', text.strip())
+
+
+def _lxml_text_content(dom, max_length=None):
+    """
+    Same as text_content, but stop collect text when it reach max_length
+    """
+    if max_length is None:
+        return _normalize_text(dom.text_content())
+    parts = []
+    size = 0
+    limit = max_length
+    for text in dom.itertext():
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            # blank lines are collapsed, the text may still not long enough
+            content = _normalize_text(''.join(parts))
+            if len(content) >= max_length:
+                return content[:max_length]
+            limit = size + max_length
+    return _normalize_text(''.join(parts))[:max_length]
+
+
+def story_html_to_text(content, clean=True, max_length=None):
     """
     >>> content = '''<html><body>
     ... <pre>hello world</pre>
@@ -416,12 +526,19 @@ def story_html_to_text(content, clean=True):
     中文传媒精选
     >>> story_html_to_text('') == ''
     True
+    >>> print(story_html_to_text(' hello > world '))
+    hello > world
     >>> # lxml can not parse below content, we handled the exception
     >>> content = "<?phpob_start();echo file_get_contents($_GET['pdf_url']);ob_flush();?>"
     >>> assert story_html_to_text(content)
+    >>> print(story_html_to_text('<p>hello world</p>' * 3, max_length=8))
+    hello wo
     """
     if (not content) or (not content.strip()):
         return ""
+    if _is_plain_text(content):
+        # eg: most titles and author names, no need to parse
+        return content.strip()[:max_length]
     try:
         if clean:
             # https://bugs.launchpad.net/lxml/+bug/1851029
@@ -429,18 +546,20 @@ def story_html_to_text(content, clean=True):
             # root tag and child tag in kill_tags set.
             if content.startswith('<pre'):
                 content = '<div>' + content + '</div>'
-            content = lxml_call(lxml_text_html_cleaner.clean_html, content).strip()
-        if not content:
-            return ""
+            content = RE_XML_CONTROL_CHARS.sub('', content)
         r = lxml_call(lxml.html.fromstring, content, parser=lxml_html_parser)
-        content = r.text_content().strip()
+        if clean:
+            # clean the parsed tree in place, avoid serialize and parse again
+            _lxml_clean_tree(lxml_text_html_cleaner, r)
+        return _lxml_text_content(r, max_length=max_length)
     except LXMLError:
         try:
-            content = lxml_call(soupparser.fromstring, content).text_content().strip()
+            r = lxml_call(soupparser.fromstring, content)
+            return _lxml_text_content(r, max_length=max_length)
         except LXMLError as ex:
             LOG.info(f'lxml unable to parse content: {ex} content={content!r}', exc_info=ex)
             content = html_escape(content)
-    return RE_BLANK_LINE.sub('\n', content)
+    return RE_BLANK_LINE.sub('\n', content)[:max_length]
 
 
 RSSANT_HTML_SAFE_ATTRS = set(lxml_safe_attrs) | set(IMG_EXT_SRC_ATTRS)
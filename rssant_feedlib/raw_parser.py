@@ -1,5 +1,6 @@
-import typing
+import re
 import json
+import typing
 import logging
 import datetime
 import time
@@ -7,6 +8,7 @@ from io import BytesIO
 
 import atoma
 import feedparser
+import orjson
 from django.utils import timezone
 from dateutil.parser import parse as parse_datetime
 from validr import mark_index, T, Invalid
@@ -23,6 +25,19 @@ feedparser.SANITIZE_HTML = False
 
 UTC = datetime.timezone.utc
 
+# orjson parse integers larger than 64 bits as lossy float, eg: numeric story id
+RE_JSON_LARGE_INT = re.compile(r'\d{19}')
+
+
+def _json_loads(text: str):
+    if not RE_JSON_LARGE_INT.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # orjson is stricter than json, eg: lone surrogate, NaN
+    return json.loads(text)
+
+
 RawFeedSchema = T.dict(
     version=T.str,
     title=T.str,
@@ -218,7 +233,7 @@ class RawFeedParser:
         except UnicodeDecodeError as ex:
             raise FeedParserError("Unicode decode error: {}".format(ex)) from ex
         try:
-            data = json.loads(text)
+            data = _json_loads(text)
         except json.JSONDecodeError as ex:
             raise FeedParserError("JSON parse error: {}".format(ex)) from ex
         return data
@@ -290,7 +305,8 @@ class RawFeedParser:
         if response.feed_type.is_other:
             warnings.append('feed content type is not any feed type')
         # content.strip is required because feedparser not allow whitespace
-        stream = BytesIO(response.content.strip())
+        # both strip and BytesIO not copy bytes content if no need to strip
+        stream = BytesIO(bytes(response.content).strip())
         # tell feedparser to use detected encoding
         headers = {
             'content-type': f'application/xml;charset={response.encoding}',
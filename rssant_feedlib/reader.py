@@ -148,15 +148,16 @@ class FeedReader:
                     content_length, self.max_content_length)
                 raise ContentTooLargeError(msg)
         content_length = 0
-        content = bytearray()
+        # keep immutable bytes, the parser can strip and wrap it without copy
+        chunks = []
         for data in response.iter_content(chunk_size=64 * 1024):
             content_length += len(data)
             if content_length > self.max_content_length:
                 msg = 'content length larger than limit {}'.format(
                     self.max_content_length)
                 raise ContentTooLargeError(msg)
-            content.extend(data)
-        return content
+            chunks.append(data)
+        return b''.join(chunks)
 
     def _decode_content(self, content: bytes):
         if not content:
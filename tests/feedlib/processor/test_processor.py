@@ -1,6 +1,10 @@
 from pathlib import Path
 from rssant_feedlib.processor import (
     story_readability,
+    story_link_count,
+    story_image_count,
+    story_html_to_text,
+    process_story_links,
     normlize_url,
     validate_url,
 )
@@ -44,6 +48,7 @@ def test_normalize_url():
         ('http://example.com%5Cblog', 'http://example.com/blog'),
         ('http://example.com%5Cblog/hello', 'http://example.com/blog/hello'),
         ('http%3A//www.example.com', 'http://www.example.com'),
+        ('http：//www.example.com', 'http://www.example.com'),
         ('http://www.example.com:80', 'http://www.example.com'),
         ('https://www.example.com:443', 'https://www.example.com'),
         (
@@ -83,3 +88,51 @@ def test_normalize_quote():
     for p in path_s:
         r = normlize_url(p, base_url=base_url)
         assert r == base + p
+
+
+def test_story_regex_backtracking():
+    contents = [
+        '<<<<<<a' * 15000,
+        '<a' + ' ' * 100000,
+        '<img' + ' ' * 100000,
+        '<source' + ' ' * 100000,
+        '<img ' + 'x ' * 50000,
+    ]
+    for content in contents:
+        assert story_link_count(content) == 0
+        assert story_image_count(content) == 0
+
+
+def test_story_html_to_text_control_chars():
+    content = '<p>hello\x08 <b>world\x02</b></p>\n<p>happy<code>\x00</code> day</p>'
+    assert story_html_to_text(content) == 'hello world\nhappy day'
+
+
+def test_process_story_links():
+    base_url = 'http://blog.example.com/post/index.html'
+    content = (
+        '<p><a href=" ../about.html">about</a><img src="1.png">'
+        '<video src="https://cdn.example.com/1.mp4"></video></p>'
+    )
+    expect = (
+        '<p><a href="http://blog.example.com/about.html" target="_blank" rel="nofollow">about</a>'
+        '<img src="http://blog.example.com/post/1.png">'
+        '<video src="https://cdn.example.com/1.mp4"></video></p>'
+    )
+    assert process_story_links(content, base_url) == expect
+    content = '<p style="background: url(bg.png)"><img src="1.png"></p>'
+    expect = (
+        '<p style="background: url(http://blog.example.com/post/bg.png)">'
+        '<img src="http://blog.example.com/post/1.png"></p>'
+    )
+    assert process_story_links(content, base_url) == expect
+    # links are relative to story link, not <base> in content
+    content = '<div><base href="http://other.com/"><a href="x">x</a></div>'
+    expect = '<div><a href="http://blog.example.com/post/x" target="_blank" rel="nofollow">x</a></div>'
+    assert process_story_links(content, base_url) == expect
+    content = '<div><base href="http://other.com/"><a href="x" style="color: red">x</a></div>'
+    expect = (
+        '<div><a href="http://blog.example.com/post/x" style="color: red" '
+        'target="_blank" rel="nofollow">x</a></div>'
+    )
+    assert process_story_links(content, base_url) == expect
@@ -133,6 +133,19 @@ def test_find_not_found(httpserver: HTTPServer):
         assert not found, f'messages={messages}'
 
 
+def test_find_links():
+    finder, messages = _create_finder('https://blog.example.com/')
+    links = finder._find_links(home_page, 'https://blog.example.com/')
+    urls = [x.url for x in links]
+    assert urls == [
+        'https://blog.example.com/t/597557',
+        'https://blog.example.com/bad-feed.xml',
+        'https://blog.example.com/ok-feed.xml',
+    ]
+    # lxml can not parse empty document, fallback to BeautifulSoup
+    assert finder._find_links('', 'https://blog.example.com/') == []
+
+
 real_urls = [
     "ruanyifeng.com",
     "https://arp242.net/feed.xml",
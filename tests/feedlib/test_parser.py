@@ -5,8 +5,10 @@ from pathlib import Path
 import pytest
 
 from rssant_feedlib import (
-    RawFeedParser, FeedParser, FeedParserError, FeedResponseBuilder,
+    RawFeedParser, RawFeedResult, FeedParser, FeedParserError, FeedResponseBuilder,
 )
+from rssant_feedlib.parser import STORY_CONTENT_MAX_LENGTH
+from rssant_feedlib.raw_parser import _json_loads
 
 
 LOG = logging.getLogger(__name__)
@@ -29,6 +31,33 @@ def _read_response(base_dir, filename):
     return response
 
 
+def _coolshell_raw_result():
+    response = _read_response(_data_dir, 'well/coolshell-cn-feed.xml')
+    return RawFeedParser().parse(response)
+
+
+def test_json_loads_compatible():
+    assert _json_loads('{"id": 123456789012345678901234567890}') == {'id': 123456789012345678901234567890}
+    assert _json_loads('{"title": "\\ud83d x"}') == {'title': '\ud83d x'}
+    data = _json_loads('{"score": NaN}')
+    assert data['score'] != data['score']
+
+
+def test_raw_parse_json_feed_not_strict():
+    content = b'''{
+        "version": "https://jsonfeed.org/version/1",
+        "title": "hello \\ud83d world",
+        "home_page_url": "https://blog.example.com/",
+        "items": [{"id": "1", "url": "https://blog.example.com/1", "content_text": "hi", "_score": NaN}]
+    }'''
+    builder = FeedResponseBuilder()
+    builder.url('https://blog.example.com/feed.json')
+    builder.content(content)
+    result = RawFeedParser().parse(builder.build())
+    assert result.feed['title'] == 'hello \ud83d world'
+    assert [x['ident'] for x in result.storys] == ['1']
+
+
 @pytest.mark.parametrize('filename', _collect_filenames(_data_dir / 'well'))
 def test_raw_parse_well(filename):
     response = _read_response(_data_dir / 'well', filename)
@@ -94,3 +123,44 @@ def test_parser_and_checksum(filepath):
     assert result.feed
     assert result.storys
     assert result.checksum.size() == len(result.storys)
+
+
+def test_parser_large_content():
+    raw_result = _coolshell_raw_result()
+    story = raw_result.storys[0]
+    content = '<div>{}</div>'.format('<p><b>hello</b></p>' * 64 * 1024)
+    assert len(content) >= STORY_CONTENT_MAX_LENGTH
+    story['content'] = '<script>alert(1)</script>' + content
+    result = FeedParser().parse(raw_result)
+    content = result.storys[0]['content']
+    assert 'hello' in content
+    assert '<b>' not in content
+    assert 'script' not in content
+
+
+def test_parser_no_update_storys():
+    raw_result = _coolshell_raw_result()
+    result = FeedParser().parse(raw_result)
+    assert result.storys
+    new_result = FeedParser(checksum=result.checksum).parse(raw_result)
+    assert new_result.feed == result.feed
+    assert new_result.storys == []
+    assert new_result.checksum == result.checksum
+
+
+def test_parser_duplicate_idents():
+    raw_result = _coolshell_raw_result()
+    storys = list(raw_result.storys)
+    duplicate_raw_result = RawFeedResult(raw_result.feed, storys + storys)
+    result = FeedParser().parse(duplicate_raw_result)
+    assert len(result.storys) == len(storys)
+    expect = FeedParser().parse(raw_result)
+    assert result.checksum == expect.checksum
+
+
+def test_parser_invalid_story_index():
+    raw_result = _coolshell_raw_result()
+    raw_result.storys[2]['dt_published'] = 'not a datetime'
+    with pytest.raises(FeedParserError) as exc_info:
+        FeedParser().parse(raw_result)
+    assert str(exc_info.value).startswith('[2].dt_published:')
@@ -1,12 +1,12 @@
 import asyncio
 import os.path
-import json
 import traceback
 import logging
 from urllib.parse import urlparse, parse_qsl
 from typing import Type
 from pathlib import Path
 
+import orjson
 import pytest
 from pytest_httpserver import HTTPServer
 from werkzeug.datastructures import Headers as HTTPHeaders
@@ -33,6 +33,9 @@ class SyncAsyncFeedReader:
     def read(self, *args, **kwargs):
         return self._loop_run(self._reader.read(*args, **kwargs))
 
+    def read_many(self, urls, **kwargs):
+        return self._loop_run(asyncio.gather(*(self._reader.read(url, **kwargs) for url in urls)))
+
     def __enter__(self):
         self._loop_run(self._reader.__aenter__())
         return self
@@ -148,8 +151,12 @@ def test_read_testdata(reader_class: Type[FeedReader], httpserver: HTTPServer, f
         urls.append(httpserver.url_for(f"/testdata/{i}"))
     options = dict(allow_private_address=True)
     with reader_class(**options) as reader:
-        for url in urls:
-            response = reader.read(url)
+        if isinstance(reader, SyncAsyncFeedReader):
+            # read concurrently, the event loop only run once
+            responses = reader.read_many(urls)
+        else:
+            responses = [reader.read(url) for url in urls]
+        for response in responses:
             assert response.ok
             assert response.content == content
             assert response.encoding
@@ -168,7 +175,7 @@ def _parse_query(qs) -> dict:
 
 def rss_proxy_handler(request: WerkzeugRequest) -> WerkzeugResponse:
     try:
-        data = json.loads(request.data.decode('utf-8'))
+        data = orjson.loads(request.data)
         assert data['token'] == _RSS_PROXY_TOKEN
         assert data.get('method') in (None, 'POST')
         url = urlparse(data['url'])